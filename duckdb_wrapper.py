@@ -1,19 +1,56 @@
 import logging
 import os
-from typing import List, Dict, Any, Union, Generator
-import pandas as pd
+import queue
+import re
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import chain
+from typing import List, Dict, Any, Union, Generator, Literal, Tuple, Iterable, TYPE_CHECKING
 
-import boto3
 import duckdb
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+CGROUP_MEMORY_MAX_PATH = "/sys/fs/cgroup/memory.max"
+SOURCE_VIEW_NAME = "_src"
+PARQUET_COMPRESSIONS = ["zstd", "snappy", "gzip", "lz4", "brotli", "uncompressed"]
+FILTER_OPERATORS = ["=", "!=", "<>", "<", "<=", ">", ">=", "LIKE", "ILIKE", "IN", "NOT IN"]
+
 
 class DuckDBWrapper:
-    def __init__(self, db_file: str = None):
+    def __init__(self, db_file: str = None, read_pool_size: int = 4, cache_dir: str = None, threads: int = None,
+                 memory_limit: str = None, temp_directory: str = None, preserve_insertion_order: bool = False):
+        """
+        :param db_file: Path to the database file, or None for an in-memory database
+        :param read_pool_size: Number of cursors used to run read-only queries concurrently
+        :param cache_dir: Directory of the on-disk S3 block cache. Setting it enables the cache_httpfs
+                          community extension in connect_to_s3 (optional)
+        :param threads: Number of DuckDB worker threads (default: DuckDB's own detection, which respects
+                        CPU affinity and cgroup CPU quotas)
+        :param memory_limit: DuckDB memory limit, e.g. '4GB' (default: 80% of the cgroup memory limit if set)
+        :param temp_directory: Directory DuckDB spills to when the memory limit is reached (optional)
+        :param preserve_insertion_order: Keep the insertion order of rows in results without ORDER BY.
+                                         Disabling it lets DuckDB parallelize more operators.
+        """
+        if read_pool_size < 1:
+            raise ValueError("read_pool_size must be at least 1")
+
         self.logger = logging.getLogger(self.__class__.__name__)
         self._conn = None
+        self._read_pool = None
         self.db_file = db_file
+        self.read_pool_size = read_pool_size
+        self.cache_dir = cache_dir
+        self.threads = threads
+        self.memory_limit = memory_limit or self._default_memory_limit()
+        self.temp_directory = temp_directory
+        self.preserve_insertion_order = preserve_insertion_order
         self.logger.info("DuckDBWrapper initialized")
 
     def __enter__(self):
@@ -25,61 +62,256 @@ class DuckDBWrapper:
 
     def create_duckdb_connection(self) -> None:
         """Establish a DuckDB connection."""
+        config = {
+            'preserve_insertion_order': self.preserve_insertion_order
+        }
+        if self.threads:
+            config['threads'] = self.threads
+        if self.memory_limit:
+            config['memory_limit'] = self.memory_limit
+        if self.temp_directory:
+            config['temp_directory'] = self.temp_directory
+
         if self.db_file:
-            self._conn = duckdb.connect(self.db_file)
+            self._conn = duckdb.connect(self.db_file, config=config)
             self.logger.info(f"DuckDB connection established with database file: {self.db_file}")
         else:
-            self._conn = duckdb.connect()
+            self._conn = duckdb.connect(config=config)
             self.logger.info("In-memory DuckDB connection established")
 
+        self._read_pool = queue.Queue()
+        for _ in range(self.read_pool_size):
+            self._read_pool.put(self._conn.cursor())
+        self.logger.info(f"Read connection pool created with {self.read_pool_size} cursors")
+
+    @contextmanager
+    def _get_read_cursor(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+        """
+        Borrow a cursor from the read pool.
+
+        When all pooled cursors are in use (e.g. nested reads in one thread), a temporary cursor is opened
+        instead of waiting. Cursors returned after close() are closed rather than put back.
+        """
+        pool = self._read_pool
+        if not pool:
+            raise ConnectionError("DuckDB connection not established. Call create_duckdb_connection() first.")
+        try:
+            cursor = pool.get_nowait()
+            pooled = True
+        except queue.Empty:
+            cursor = self._conn.cursor()
+            pooled = False
+        try:
+            yield cursor
+        finally:
+            if pooled and self._read_pool is pool:
+                pool.put(cursor)
+            else:
+                cursor.close()
+
+    @contextmanager
+    def _get_cursor(self, read_only: bool) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+        """Yield a pooled cursor for read-only queries, and the primary connection otherwise."""
+        if not read_only:
+            yield self._conn
+            return
+        with self._get_read_cursor() as cursor:
+            yield cursor
+
+    @contextmanager
+    def _registered_source(self, data: Any, schema: pa.Schema = None) -> Generator[
+            Tuple[duckdb.DuckDBPyConnection, Union[pa.Table, pa.RecordBatchReader, "pd.DataFrame"]], None, None]:
+        """
+        Register the given data as a view named SOURCE_VIEW_NAME and yield the connection to query it on.
+
+        Arrow and pandas objects are scanned by DuckDB as they are, polars DataFrames are converted with
+        to_arrow() (zero-copy) and lists of dictionaries are converted to a pyarrow Table.
+
+        Materialized data is registered on the primary connection. Record batch readers are registered on a
+        dedicated cursor instead: they may stream from a pending result of the primary connection, which
+        cannot be read while a statement runs on that same connection.
+        """
+        if isinstance(data, list):
+            source = pa.Table.from_pylist(data, schema=schema)
+        elif type(data).__module__.startswith("polars"):
+            source = data.to_arrow()
+        else:
+            source = data
+
+        if isinstance(source, pa.RecordBatchReader):
+            conn = self._conn.cursor()
+        else:
+            conn = self._conn
+
+        conn.register(SOURCE_VIEW_NAME, source)
+        try:
+            yield conn, source
+        finally:
+            conn.unregister(SOURCE_VIEW_NAME)
+            if conn is not self._conn:
+                conn.close()
+
     def connect_to_s3(self) -> None:
         """Set up S3 connection for DuckDB."""
 
-        def set_s3_credentials(aws_creds: Any) -> None:
-            """Set S3 credentials in DuckDB."""
-            for key, value in aws_creds.items():
-                self._conn.execute(f"SET {key}='{value}'")
+        def set_s3_credentials(aws_creds: Dict[str, Any]) -> None:
+            """Register the S3 credentials as a DuckDB secret."""
+            options = ", ".join(
+                f"{key} {self._quote_literal(value)}" for key, value in aws_creds.items() if value is not None
+            )
+            self._conn.execute(f"CREATE OR REPLACE SECRET aws_default (TYPE S3, {options})")
             self.logger.info("S3 credentials set in DuckDB")
 
         def install_and_load_extensions() -> None:
-            """Install and load required extensions."""
-            extensions = ["httpfs", "aws"]
-            for ext in extensions:
-                self._conn.install_extension(ext)
-                self._conn.load_extension(ext)
+            """Install and load required extensions, skipping the ones already installed or loaded."""
+            extensions = {"httpfs": None, "aws": None}
+            if self.cache_dir:
+                extensions["cache_httpfs"] = "community"
+            placeholders = ", ".join("?" for _ in extensions)
+            status = {
+                name: (installed, loaded)
+                for name, installed, loaded in self._conn.execute(
+                    f"SELECT extension_name, installed, loaded FROM duckdb_extensions() "
+                    f"WHERE extension_name IN ({placeholders})",
+                    list(extensions)
+                ).fetchall()
+            }
+            for ext, repository in extensions.items():
+                installed, loaded = status.get(ext, (False, False))
+                if not installed:
+                    self._conn.install_extension(ext, repository=repository)
+                if not loaded:
+                    self._conn.load_extension(ext)
             self.logger.info("Required extensions installed and loaded")
 
+        def configure_cache() -> None:
+            """Point the cache_httpfs on-disk block cache to the configured directory."""
+            if self.cache_dir:
+                self._conn.execute(f"SET cache_httpfs_cache_directory = {self._quote_literal(self.cache_dir)}")
+                self.logger.info(f"S3 block cache directory set to '{self.cache_dir}'")
+
         if not self._conn:
             raise ConnectionError("DuckDB connection not established. Call connect() first.")
+
+        import boto3
+
         session = boto3.session.Session()
         sts = session.client("sts")
         sts.get_caller_identity()
         aws_creds = session.get_credentials().get_frozen_credentials()
         aws_config = {
-            's3_access_key_id': aws_creds.access_key,
-            's3_secret_access_key': aws_creds.secret_key,
-            's3_session_token': aws_creds.token,
-            's3_region': session.region_name
+            'KEY_ID': aws_creds.access_key,
+            'SECRET': aws_creds.secret_key,
+            'SESSION_TOKEN': aws_creds.token,
+            'REGION': session.region_name
         }
 
-        set_s3_credentials(aws_config)
         install_and_load_extensions()
+        configure_cache()
+        set_s3_credentials(aws_config)
 
     def close(self) -> None:
         """Close the database connection."""
+        if self._read_pool:
+            while not self._read_pool.empty():
+                self._read_pool.get().close()
+            self._read_pool = None
         if self._conn:
             self._conn.close()
             self._conn = None
             self.logger.info("Database connection closed")
 
-    def execute_query(self, query: str, params: Union[List, Dict] = None) -> List[Dict[str, Any]]:
-        """Execute a query and return all results."""
-        self.logger.info(f"Executing query: {query}")
+    def _in_transaction(self) -> bool:
+        """Return True when a transaction opened by the caller is active on the primary connection."""
+        # Outside an explicit transaction every statement runs in its own transaction, with a new id
+        first_id = self._conn.execute("SELECT txid_current()").fetchone()[0]
+        return self._conn.execute("SELECT txid_current()").fetchone()[0] == first_id
+
+    @staticmethod
+    def _arrow_reader(result: duckdb.DuckDBPyConnection, batch_size: int) -> pa.RecordBatchReader:
+        """Return an Arrow RecordBatchReader over the pending result, on both current and older duckdb versions."""
+        if hasattr(result, "to_arrow_reader"):
+            return result.to_arrow_reader(batch_size)
+        return result.fetch_record_batch(rows_per_batch=batch_size)
+
+    @staticmethod
+    def _default_memory_limit() -> Union[str, None]:
+        """Return 80% of the cgroup v2 memory limit when running in a container, None otherwise."""
         try:
-            result = self._conn.execute(query, params)
-            columns = [desc[0] for desc in result.description]
-            data = [dict(zip(columns, row)) for row in result.fetchall()]
-            self.logger.info(f"Query executed successfully. Returned {len(data)} rows.")
+            with open(CGROUP_MEMORY_MAX_PATH) as f:
+                memory_max = f.read().strip()
+        except OSError:
+            return None
+        if not memory_max.isdigit():
+            return None
+        return f"{int(memory_max) * 8 // 10 // (1024 * 1024)}MiB"
+
+    @staticmethod
+    def _compression_options(compression: str) -> str:
+        """Return the COPY options for the given Parquet compression codec."""
+        compression = compression.lower()
+        if compression not in PARQUET_COMPRESSIONS:
+            raise ValueError(f"compression must be one of {', '.join(PARQUET_COMPRESSIONS)}")
+        if compression == "zstd":
+            return "COMPRESSION ZSTD, COMPRESSION_LEVEL 3"
+        return f"COMPRESSION {compression.upper()}"
+
+    @staticmethod
+    def _quote_literal(value: Any) -> str:
+        """Quote a value as a SQL string literal, for statements that do not accept query parameters."""
+        escaped_value = str(value).replace("'", "''")
+        return f"'{escaped_value}'"
+
+    @staticmethod
+    def _validate_identifier(identifier: str) -> str:
+        """Make sure the given identifier is a plain SQL identifier before it is inserted into a query."""
+        if not IDENTIFIER_PATTERN.match(identifier):
+            raise ValueError(f"Invalid identifier: '{identifier}'")
+        return identifier
+
+    def execute_query(self, query: str, params: Union[List, Dict] = None,
+                      return_type: Literal["dicts", "namedtuples", "arrow", "df", "polars"] = "arrow",
+                      read_only: bool = False) -> Union[
+            pa.Table, "pd.DataFrame", List[Dict[str, Any]], Any]:
+        """
+        Execute a query and return all results.
+
+        :param query: SQL query to execute
+        :param params: Query parameters (optional)
+        :param return_type: Format of the result: 'arrow' (pyarrow Table), 'df' (pandas DataFrame),
+                            'polars' (polars DataFrame), 'dicts' (list of dictionaries) or
+                            'namedtuples' (list of named tuples, fields renamed where the column
+                            name is not a valid identifier)
+        :param read_only: Run the query on a pooled cursor so it can execute in parallel with other reads.
+                          Only use it for queries that do not rely on connection state such as open
+                          transactions or temporary tables.
+        :return: Query result in the requested format
+        """
+        if return_type not in ["dicts", "namedtuples", "arrow", "df", "polars"]:
+            raise ValueError("return_type must be one of 'dicts', 'namedtuples', 'arrow', 'df' or 'polars'")
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing query: %s", query)
+        try:
+            with self._get_cursor(read_only) as cursor:
+                result = cursor.execute(query, params)
+                if return_type == "df":
+                    data = result.df()
+                elif return_type == "polars":
+                    data = result.pl()
+                elif return_type == "namedtuples":
+                    row_type = namedtuple("Row", [desc[0] for desc in result.description], rename=True)
+                    data = list(map(row_type._make, result.fetchall()))
+                else:
+                    reader = self._arrow_reader(result, 1_000_000)
+                    if return_type == "dicts":
+                        data = []
+                        for batch in reader:
+                            data.extend(batch.to_pylist())
+                    else:
+                        data = reader.read_all()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Query executed successfully. Returned %s rows.", len(data))
             return data
         except duckdb.Error as e:
             self.logger.error(f"DuckDB error executing query: {str(e)}")
@@ -88,23 +320,73 @@ class DuckDBWrapper:
             self.logger.error(f"Unexpected error executing query: {str(e)}")
             raise
 
-    def execute_query_fetch_one(self, query: str, params: Union[List, Dict] = None) -> Generator[
-        Dict[str, Any], None, None]:
-        """Execute a query and yield results one at a time."""
-        self.logger.info(f"Executing query with fetch one: {query}")
+    def execute_many(self, query: str, param_sets: List[Union[List, Tuple, Dict]]) -> None:
+        """
+        Execute a statement once per parameter set, in a single transaction on the primary connection.
+
+        Meant for INSERT/UPDATE/DELETE statements: results are not returned, so use execute_query for
+        queries that produce rows. When no transaction is active, one is opened and committed here, and
+        rolled back if any execution fails. Inside a transaction opened by the caller, committing or
+        rolling back is left to the caller.
+
+        :param query: SQL statement to execute
+        :param param_sets: List of parameter lists, tuples or dictionaries, one per execution
+        """
+        if not param_sets:
+            raise ValueError("No parameter sets provided to execute the statement with")
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing statement for %s parameter sets: %s", len(param_sets), query)
+        try:
+            if self._in_transaction():
+                self._conn.executemany(query, param_sets)
+                return
+
+            self._conn.begin()
+            try:
+                self._conn.executemany(query, param_sets)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        except duckdb.Error as e:
+            self.logger.error(f"DuckDB error executing statement with multiple parameter sets: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error executing statement with multiple parameter sets: {str(e)}")
+            raise
+
+    def execute_query_df(self, query: str, params: Union[List, Dict] = None,
+                         read_only: bool = False) -> "pd.DataFrame":
+        """Execute a query and return all results as a pandas DataFrame."""
+        return self.execute_query(query, params, return_type="df", read_only=read_only)
+
+    def execute_query_pl(self, query: str, params: Union[List, Dict] = None,
+                         read_only: bool = False) -> "pl.DataFrame":
+        """Execute a query and return all results as a polars DataFrame (requires polars)."""
+        return self.execute_query(query, params, return_type="polars", read_only=read_only)
+
+    def execute_query_fetch_one(self, query: str, params: Union[List, Dict] = None, batch_size: int = 8192,
+                                read_only: bool = False) -> Generator[Dict[str, Any], None, None]:
+        """
+        Execute a query and yield results one at a time.
+
+        Rows are fetched from DuckDB in Arrow batches of `batch_size` rows and converted to dictionaries per batch.
+        With `read_only=True` the query runs on a pooled cursor, see execute_query.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing query with fetch one: %s", query)
         try:
-            result = self._conn.execute(query, params)
-            columns = [desc[0] for desc in result.description]
-            row_count = 0
-
-            while True:
-                row = result.fetchone()
-                if row is None:
-                    break
-                row_count += 1
-                yield dict(zip(columns, row))
-
-            self.logger.info(f"Query executed successfully. Yielded {row_count} rows.")
+            with self._get_cursor(read_only) as cursor:
+                reader = self._arrow_reader(cursor.execute(query, params), batch_size)
+                row_count = 0
+
+                for batch in reader:
+                    row_count += batch.num_rows
+                    yield from batch.to_pylist()
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Query executed successfully. Yielded %s rows.", row_count)
         except duckdb.Error as e:
             self.logger.error(f"DuckDB error executing query with fetch one: {str(e)}")
             raise
@@ -112,13 +394,51 @@ class DuckDBWrapper:
             self.logger.error(f"Unexpected error executing query with fetch one: {str(e)}")
             raise
 
-    def save_parquet(self, data: List[Dict[str, Any]], complete_file_name: str):
+    def execute_query_stream_arrow(self, query: str, params: Union[List, Dict] = None, batch_size: int = 8192,
+                                   read_only: bool = False) -> Generator[pa.RecordBatch, None, None]:
+        """
+        Execute a query and yield results as Arrow record batches of at most `batch_size` rows.
+
+        With `read_only=True` the query runs on a pooled cursor, see execute_query.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing query with Arrow stream: %s", query)
+        try:
+            with self._get_cursor(read_only) as cursor:
+                reader = self._arrow_reader(cursor.execute(query, params), batch_size)
+                row_count = 0
+
+                for batch in reader:
+                    row_count += batch.num_rows
+                    yield batch
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Query executed successfully. Yielded %s rows.", row_count)
+        except duckdb.Error as e:
+            self.logger.error(f"DuckDB error executing query with Arrow stream: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error executing query with Arrow stream: {str(e)}")
+            raise
+
+    def save_parquet(self, data: Union[List[Dict[str, Any]], pa.Table, pa.RecordBatchReader, "pd.DataFrame",
+                                       "pl.DataFrame"], complete_file_name: str, compression: str = "zstd"):
+        """
+        Save data to a Parquet file.
+
+        :param data: List of dictionaries, pyarrow Table, pyarrow RecordBatchReader, pandas DataFrame
+                     or polars DataFrame
+        :param complete_file_name: Full path of the Parquet file (can be local or S3 path)
+        :param compression: Parquet compression codec (default: 'zstd')
+        """
         self.logger.info(f"Saving data to Parquet file at '{complete_file_name}'")
         try:
-            df = pd.DataFrame(data)
-            self._conn.execute("CREATE TEMPORARY TABLE temp_table AS SELECT * FROM df")
-            self._conn.execute(f"COPY temp_table TO '{complete_file_name}'")
-            self._conn.execute("DROP TABLE temp_table")
+            with self._registered_source(data) as (conn, _):
+                conn.execute(
+                    f"COPY (SELECT * FROM {SOURCE_VIEW_NAME}) TO ? "
+                    f"(FORMAT PARQUET, {self._compression_options(compression)}, ROW_GROUP_SIZE 122880)",
+                    [complete_file_name]
+                )
             self.logger.info(f"Data saved to '{complete_file_name}' successfully.")
         except duckdb.Error as e:
             self.logger.error(f"DuckDB error saving Parquet file: {str(e)}")
@@ -127,32 +447,94 @@ class DuckDBWrapper:
             self.logger.error(f"Unexpected error saving Parquet file: {str(e)}")
             raise
 
-    def read_file(self, file_path: str, file_type: str, select_columns: List[str] = None, filter_conditions: List[str] = None) -> List[Dict[str, Any]]:
+    def save_parquet_stream(self, reader: Union[pa.RecordBatchReader, Iterable[pa.RecordBatch]],
+                            complete_file_name: str, compression: str = "zstd") -> None:
+        """
+        Save a stream of Arrow record batches to a Parquet file.
+
+        DuckDB pulls the batches on demand while writing, so only a few batches are held in memory at a time.
+        The output of execute_query_stream_arrow can be passed in directly.
+
+        :param reader: pyarrow RecordBatchReader or iterable of pyarrow RecordBatches
+        :param complete_file_name: Full path of the Parquet file (can be local or S3 path)
+        :param compression: Parquet compression codec (default: 'zstd')
+        """
+        if not isinstance(reader, pa.RecordBatchReader):
+            batches = iter(reader)
+            first_batch = next(batches, None)
+            if first_batch is None:
+                raise ValueError("No record batches provided to save")
+            reader = pa.RecordBatchReader.from_batches(first_batch.schema, chain([first_batch], batches))
+
+        self.save_parquet(reader, complete_file_name, compression=compression)
+
+    def read_file(self, file_path: Union[str, List[str]], file_type: str, select_columns: List[str] = None,
+                  filter_conditions: List[Union[str, Tuple[str, str, Any]]] = None,
+                  csv_columns: Dict[str, str] = None,
+                  return_type: Literal["dicts", "namedtuples", "arrow", "df", "polars"] = "arrow") -> Union[
+            pa.Table, "pd.DataFrame", List[Dict[str, Any]], Any]:
         """
         Read data from a CSV or Parquet file.
 
-        :param file_path: Path to the file (can be local or S3 path)
+        Parquet files are read with hive partitioning and union by name enabled; DuckDB pushes the
+        selected columns and filters down into the Parquet scan.
+
+        :param file_path: Path to the file, or list of paths (can be local or S3 paths)
         :param file_type: Type of file ('csv' or 'parquet')
         :param select_columns: List of columns to select (optional)
-        :param filter_conditions: List of filter conditions to apply (optional)
-        :return: List of dictionaries containing the data
+        :param filter_conditions: List of filter conditions to apply (optional). Conditions given as
+                                  (column, operator, value) tuples are bound as query parameters; plain
+                                  strings are inserted into the WHERE clause as-is.
+        :param csv_columns: Mapping of column names to DuckDB types for CSV files, which skips schema
+                            sniffing (optional)
+        :param return_type: Format of the result, see execute_query
+        :return: Data in the requested format
         """
         if file_type not in ['csv', 'parquet']:
             raise ValueError("file_type must be either 'csv' or 'parquet'")
 
         self.logger.info(f"Reading {file_type.upper()} file from '{file_path}'")
         try:
+            if file_type == 'parquet':
+                source = "read_parquet(?, hive_partitioning=true, union_by_name=true)"
+                params = [file_path]
+            elif csv_columns:
+                source = "read_csv(?, columns=?)"
+                params = [file_path, csv_columns]
+            else:
+                source = "read_csv(?)"
+                params = [file_path]
+
             if select_columns:
-                columns = ", ".join(select_columns)
-                query = f"SELECT {columns} FROM read_{file_type}('{file_path}')"
+                columns = ", ".join(self._validate_identifier(column) for column in select_columns)
+                query = f"SELECT {columns} FROM {source}"
             else:
-                query = f"SELECT * FROM read_{file_type}('{file_path}')"
+                query = f"SELECT * FROM {source}"
 
             if filter_conditions:
-                conditions = " AND ".join(f"({condition})" for condition in filter_conditions)
-                query += f" WHERE {conditions}"
+                conditions = []
+                for condition in filter_conditions:
+                    if isinstance(condition, str):
+                        conditions.append(f"({condition})")
+                        continue
+                    column, operator, value = condition
+                    column = self._validate_identifier(column)
+                    operator = operator.upper()
+                    if operator not in FILTER_OPERATORS:
+                        raise ValueError(f"Unsupported filter operator: '{operator}'")
+                    if operator in ["IN", "NOT IN"]:
+                        if not isinstance(value, (list, tuple)) or not value:
+                            raise ValueError(f"Filter value for '{operator}' on '{column}' must be a non-empty "
+                                             f"list or tuple")
+                        placeholders = ", ".join("?" for _ in value)
+                        conditions.append(f"({column} {operator} ({placeholders}))")
+                        params.extend(value)
+                    else:
+                        conditions.append(f"({column} {operator} ?)")
+                        params.append(value)
+                query += f" WHERE {' AND '.join(conditions)}"
 
-            result = self.execute_query(query)
+            result = self.execute_query(query, params, return_type=return_type, read_only=True)
             self.logger.info(f"Data read from '{file_path}' successfully. Returned {len(result)} rows.")
             return result
         except duckdb.Error as e:
@@ -162,20 +544,30 @@ class DuckDBWrapper:
             self.logger.error(f"Unexpected error reading {file_type.upper()} file: {str(e)}")
             raise
 
-    def create_table(self, table_name: str, data: List[Dict[str, Any]]) -> None:
+    def create_table(self, table_name: str, data: Union[List[Dict[str, Any]], pa.Table, pa.RecordBatchReader,
+                                                        "pd.DataFrame", "pl.DataFrame"],
+                     schema: pa.Schema = None) -> None:
         """
         Create a table from the given data. DuckDB will infer the schema from the given data.
+
+        :param table_name: Name of the table to create
+        :param data: List of dictionaries, pyarrow Table, pyarrow RecordBatchReader, pandas DataFrame
+                     or polars DataFrame. RecordBatchReaders are loaded on a separate cursor, outside any
+                     transaction open on the primary connection.
+        :param schema: Arrow schema to apply when converting a list of dictionaries (optional)
         """
         self.logger.info(f"Creating table '{table_name}'")
         try:
-            if not data:
+            if data is None or (not isinstance(data, pa.RecordBatchReader) and len(data) == 0):
                 raise ValueError("No data provided to create the table")
 
-            df = pd.DataFrame(data)
-
-            query = f"CREATE TABLE {table_name} AS SELECT * FROM df"
-            self._conn.execute(query)
-            self.logger.info(f"Table '{table_name}' created successfully with {len(data)} rows")
+            with self._registered_source(data, schema) as (conn, source):
+                query = f"CREATE TABLE {table_name} AS SELECT * FROM {SOURCE_VIEW_NAME}"
+                conn.execute(query)
+            if isinstance(source, pa.RecordBatchReader):
+                self.logger.info(f"Table '{table_name}' created successfully")
+            else:
+                self.logger.info(f"Table '{table_name}' created successfully with {len(source)} rows")
         except duckdb.Error as e:
             self.logger.error(f"DuckDB error creating table: {str(e)}")
             raise
@@ -183,18 +575,22 @@ class DuckDBWrapper:
             self.logger.error(f"Unexpected error creating table: {str(e)}")
             raise
 
-    def save_table_as_parquet(self, table_name: str, file_path: str, file_name: str) -> None:
+    def save_table_as_parquet(self, table_name: str, file_path: str, file_name: str,
+                              compression: str = "zstd") -> None:
         """
         Save a DuckDB table as a Parquet file.
         :param table_name: Name of the table to be saved
         :param file_path: Directory path where the Parquet file will be saved
         :param file_name: Name of the Parquet file (without extension)
+        :param compression: Parquet compression codec (default: 'zstd')
         """
         full_path = os.path.join(file_path, f"{file_name}.parquet")
         self.logger.info(f"Saving table '{table_name}' as Parquet file: {full_path}")
         try:
-            query = f"COPY (SELECT * FROM {table_name}) TO '{full_path}' (FORMAT PARQUET)"
-            self._conn.execute(query)
+            table = ".".join(self._validate_identifier(part) for part in table_name.split("."))
+            query = (f"COPY {table} TO ? (FORMAT PARQUET, {self._compression_options(compression)}, "
+                     f"ROW_GROUP_SIZE 122880, PARQUET_VERSION V2)")
+            self._conn.execute(query, [full_path])
             self.logger.info(f"Table '{table_name}' successfully saved as Parquet file: {full_path}")
         except duckdb.Error as e:
             self.logger.error(f"DuckDB error saving table as Parquet: {str(e)}")